@@ -0,0 +1,52 @@
+import os
+import threading
+from collections import OrderedDict
+
+from openpyxl import Workbook, load_workbook
+
+# Maximum number of parsed workbooks kept in memory
+MAX_CACHED_WORKBOOKS = 16
+
+# (abs_path, data_only) -> ((mtime_ns, size), workbook), least recently used first
+_cache: OrderedDict[tuple[str, bool], tuple[tuple[int, int], Workbook]] = OrderedDict()
+_lock = threading.Lock()
+
+def get_workbook(filepath: str, *, data_only: bool = False) -> Workbook:
+    """Load a workbook, reusing the parsed copy while the file is unchanged.
+
+    Cached workbooks are shared between callers, so they must only be read,
+    never modified or saved.
+
+    Args:
+        filepath: Path to Excel file
+        data_only: Load cached formula results instead of formulas
+
+    Returns:
+        Parsed workbook
+    """
+    path = os.path.abspath(filepath)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = (path, data_only)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == version:
+            _cache.move_to_end(key)
+            return entry[1]
+
+    wb = load_workbook(path, data_only=data_only)
+
+    with _lock:
+        _cache[key] = (version, wb)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_WORKBOOKS:
+            _cache.popitem(last=False)
+    return wb
+
+def invalidate(filepath: str) -> None:
+    """Drop any cached copies of a workbook after it has been modified."""
+    path = os.path.abspath(filepath)
+    with _lock:
+        for data_only in (False, True):
+            _cache.pop((path, data_only), None)
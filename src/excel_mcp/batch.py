@@ -0,0 +1,93 @@
+import logging
+from typing import Any, Callable
+
+from openpyxl import Workbook, load_workbook
+
+from .calculations import apply_formula
+from .data import write_data
+from .exceptions import ExcelMCPError, ValidationError, WorkbookError
+from .formatting import format_range
+from .sheet import merge_range, unmerge_range
+
+logger = logging.getLogger(__name__)
+
+def _write_data_to_excel(
+    filepath: str,
+    wb: Workbook,
+    input_data: list[list] | None = None,
+    **params: Any
+) -> dict[str, Any]:
+    # The tool calls the rows input_data, write_data calls them data
+    return write_data(filepath, data=input_data, wb=wb, **params)
+
+# Operation name (matching the standalone tool) -> function taking the
+# tool's parameters plus the shared workbook
+OPERATIONS: dict[str, Callable[..., dict[str, Any]]] = {
+    "write_data_to_excel": _write_data_to_excel,
+    "apply_formula": apply_formula,
+    "format_range": format_range,
+    "merge_cells": merge_range,
+    "unmerge_cells": unmerge_range,
+}
+
+def batch_edit(filepath: str, operations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply several edits to a workbook with a single load and save.
+
+    Each operation is a dictionary with an 'operation' key naming one of
+    OPERATIONS and the remaining keys holding that tool's parameters
+    (without filepath). Operations run in order against the same in-memory
+    workbook, which is saved once after all of them succeed. If any
+    operation fails, nothing is written to disk.
+
+    Args:
+        filepath: Path to Excel file
+        operations: List of operation dictionaries
+
+    Returns:
+        Dictionary with the message of every operation
+    """
+    if not operations:
+        raise ValidationError("No operations provided")
+
+    try:
+        wb = load_workbook(filepath)
+    except Exception as e:
+        logger.error(f"Failed to load workbook for batch edit: {e}")
+        raise WorkbookError(f"Failed to load workbook: {e!s}") from e
+
+    try:
+        messages = []
+        for index, operation in enumerate(operations, 1):
+            if not isinstance(operation, dict):
+                raise ValidationError(f"Operation {index} must be a dictionary")
+
+            params = dict(operation)
+            name = params.pop("operation", None)
+            func = OPERATIONS.get(name)
+            if func is None:
+                raise ValidationError(
+                    f"Operation {index}: unknown operation '{name}', "
+                    f"expected one of {', '.join(OPERATIONS)}"
+                )
+            params.pop("filepath", None)
+
+            try:
+                result = func(filepath, wb=wb, **params)
+            except TypeError as e:
+                raise ValidationError(f"Operation {index} ({name}): invalid parameters: {e}") from e
+            except ExcelMCPError as e:
+                raise type(e)(f"Operation {index} ({name}): {e}") from e
+            messages.append(result["message"])
+
+        try:
+            wb.save(filepath)
+        except Exception as e:
+            logger.error(f"Failed to save workbook after batch edit: {e}")
+            raise WorkbookError(f"Failed to save workbook: {e!s}") from e
+    finally:
+        wb.close()
+
+    return {
+        "message": f"Applied {len(messages)} operations",
+        "results": messages
+    }
@@ -1,6 +1,8 @@
 from typing import Any
 import logging
 
+from openpyxl import Workbook
+
 from .workbook import get_or_create_workbook
 from .cell_utils import validate_cell_reference
 from .exceptions import ValidationError, CalculationError
@@ -12,14 +14,22 @@ def apply_formula(
     filepath: str,
     sheet_name: str,
     cell: str,
-    formula: str
+    formula: str,
+    *,
+    wb: Workbook | None = None
 ) -> dict[str, Any]:
-    """Apply any Excel formula to a cell."""
+    """Apply any Excel formula to a cell.
+    
+    When an already-loaded workbook is passed as wb, it is modified
+    in place and saving is left to the caller.
+    """
     try:
         if not validate_cell_reference(cell):
             raise ValidationError(f"Invalid cell reference: {cell}")
             
-        wb = get_or_create_workbook(filepath)
+        owns_wb = wb is None
+        if owns_wb:
+            wb = get_or_create_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise ValidationError(f"Sheet '{sheet_name}' not found")
             
@@ -41,10 +51,11 @@ def apply_formula(
         except Exception as e:
             raise CalculationError(f"Failed to apply formula to cell: {str(e)}")
             
-        try:
-            wb.save(filepath)
-        except Exception as e:
-            raise CalculationError(f"Failed to save workbook after applying formula: {str(e)}")
+        if owns_wb:
+            try:
+                wb.save(filepath)
+            except Exception as e:
+                raise CalculationError(f"Failed to save workbook after applying formula: {str(e)}")
         
         return {
             "message": f"Applied formula '{formula}' to cell {cell}",
@@ -2,16 +2,27 @@ from pathlib import Path
 from typing import Any
 import logging
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.styles import Font
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter
 
 from .exceptions import DataError
 from .cell_utils import parse_cell_range
+from ._wb_cache import get_workbook
 
 logger = logging.getLogger(__name__)
 
+def _cell_value(ws: Worksheet, row: int, column: int) -> Any:
+    """Read a cell value without creating the cell.
+    
+    Worksheet.cell() adds missing cells to the sheet, which would grow the
+    dimensions of a shared cached workbook.
+    """
+    cell = ws._cells.get((row, column))
+    return None if cell is None else cell.value
+
 def read_excel_range(
     filepath: Path | str,
     sheet_name: str,
@@ -21,7 +32,7 @@ def read_excel_range(
 ) -> list[dict[str, Any]]:
     """Read data from Excel range with optional preview mode"""
     try:
-        wb = load_workbook(filepath, read_only=False)
+        wb = get_workbook(filepath)
         
         if sheet_name not in wb.sheetnames:
             raise DataError(f"Sheet '{sheet_name}' not found")
@@ -53,9 +64,9 @@ def read_excel_range(
         else:
             # Dynamically expand range until all values are empty
             end_row, end_col = start_row, start_col
-            while end_row <= ws.max_row and any(ws.cell(row=end_row, column=c).value is not None for c in range(start_col, ws.max_column + 1)):
+            while end_row <= ws.max_row and any(_cell_value(ws, end_row, c) is not None for c in range(start_col, ws.max_column + 1)):
                 end_row += 1
-            while end_col <= ws.max_column and any(ws.cell(row=r, column=end_col).value is not None for r in range(start_row, ws.max_row + 1)):
+            while end_col <= ws.max_column and any(_cell_value(ws, r, end_col) is not None for r in range(start_row, ws.max_row + 1)):
                 end_col += 1
             end_row -= 1  # Adjust back to last non-empty row
             end_col -= 1  # Adjust back to last non-empty column
@@ -71,12 +82,10 @@ def read_excel_range(
         for row in range(start_row, end_row + 1):
             row_data = []
             for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=row, column=col)
-                row_data.append(cell.value)
+                row_data.append(_cell_value(ws, row, col))
             if any(v is not None for v in row_data):
                 data.append(row_data)
 
-        wb.close()
         return data
     except DataError as e:
         logger.error(str(e))
@@ -90,16 +99,22 @@ def write_data(
     sheet_name: str | None,
     data: list[list] | None,
     start_cell: str = "A1",
+    *,
+    wb: Workbook | None = None,
 ) -> dict[str, str]:
     """Write data to Excel sheet with workbook handling
     
     Headers are handled intelligently based on context.
+    When an already-loaded workbook is passed as wb, it is modified
+    in place and saving is left to the caller.
     """
     try:
         if not data:
             raise DataError("No data provided to write")
             
-        wb = load_workbook(filepath)
+        owns_wb = wb is None
+        if owns_wb:
+            wb = load_workbook(filepath)
 
         # If no sheet specified, use active sheet
         if not sheet_name:
@@ -120,8 +135,9 @@ def write_data(
         if len(data) > 0:
             _write_data_to_worksheet(ws, data, start_cell)
 
-        wb.save(filepath)
-        wb.close()
+        if owns_wb:
+            wb.save(filepath)
+            wb.close()
 
         return {"message": f"Data written to {sheet_name}", "active_sheet": sheet_name}
     except DataError as e:
@@ -234,10 +250,24 @@ def _write_data_to_worksheet(
         except ValueError as e:
             raise DataError(f"Invalid start cell format: {str(e)}")
 
-        # Write data
-        for i, row in enumerate(data):
-            for j, val in enumerate(row):
-                worksheet.cell(row=start_row + i, column=start_col + j, value=val)
+        # Check the row limit Worksheet.cell() enforces once for the whole block
+        end_row = start_row + len(data) - 1
+        if end_row > 1048576:
+            raise DataError(f"Row numbers must be between 1 and 1048576. Row number supplied was {end_row}")
+
+        # Look cells up in the cell store directly instead of calling
+        # Worksheet.cell() per value. As with cell(), missing cells are
+        # registered through _add_cell (which keeps the append position
+        # current) and None never overwrites a value.
+        cells = worksheet._cells
+        add_cell = worksheet._add_cell
+        for row_idx, row in enumerate(data, start_row):
+            for col_idx, val in enumerate(row, start_col):
+                cell = cells.get((row_idx, col_idx))
+                if cell is None:
+                    add_cell(Cell(worksheet, row=row_idx, column=col_idx, value=val))
+                elif val is not None:
+                    cell.value = val
     except DataError as e:
         logger.error(str(e))
         raise
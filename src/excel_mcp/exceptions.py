@@ -33,3 +33,7 @@ class PivotError(ExcelMCPError):
 class ChartError(ExcelMCPError):
     """Raised when chart operations fail."""
     pass
+
+class ReformatError(ExcelMCPError):
+    """Raised when data reformatting scripts fail."""
+    pass
@@ -1,6 +1,8 @@
+import functools
 import logging
 from typing import Any, Dict
 
+from openpyxl import Workbook
 from openpyxl.styles import (
     PatternFill, Border, Side, Alignment, Protection, Font,
     Color
@@ -16,6 +18,57 @@ from .exceptions import ValidationError, FormattingError
 
 logger = logging.getLogger(__name__)
 
+# Style objects are immutable once built, so identical formatting requests
+# share one instance instead of constructing (and hashing) a new one each call
+
+@functools.lru_cache(maxsize=256)
+def _font(bold: bool, italic: bool, underline: bool, size: int | None, color: str | None) -> Font:
+    font_args = {
+        "bold": bold,
+        "italic": italic,
+        "underline": 'single' if underline else None,
+    }
+    if size is not None:
+        font_args["size"] = size
+    if color is not None:
+        # Ensure color has FF prefix for full opacity
+        color = color if color.startswith('FF') else f'FF{color}'
+        font_args["color"] = Color(rgb=color)
+    return Font(**font_args)
+
+@functools.lru_cache(maxsize=256)
+def _fill(bg_color: str) -> PatternFill:
+    # Ensure color has FF prefix for full opacity
+    bg_color = bg_color if bg_color.startswith('FF') else f'FF{bg_color}'
+    return PatternFill(
+        start_color=Color(rgb=bg_color),
+        end_color=Color(rgb=bg_color),
+        fill_type='solid'
+    )
+
+@functools.lru_cache(maxsize=256)
+def _border(style: str, color: str | None) -> Border:
+    color = color if color else "000000"
+    color = color if color.startswith('FF') else f'FF{color}'
+    side = Side(
+        style=style,
+        color=Color(rgb=color)
+    )
+    return Border(
+        left=side,
+        right=side,
+        top=side,
+        bottom=side
+    )
+
+@functools.lru_cache(maxsize=256)
+def _alignment(horizontal: str | None, vertical: str | None, wrap_text: bool) -> Alignment:
+    return Alignment(
+        horizontal=horizontal,
+        vertical=vertical,
+        wrap_text=wrap_text
+    )
+
 def format_range(
     filepath: str,
     sheet_name: str,
@@ -34,7 +87,9 @@ def format_range(
     wrap_text: bool = False,
     merge_cells: bool = False,
     protection: Dict[str, Any] = None,
-    conditional_format: Dict[str, Any] = None
+    conditional_format: Dict[str, Any] = None,
+    *,
+    wb: Workbook = None
 ) -> Dict[str, Any]:
     """Apply formatting to a range of cells.
     
@@ -67,6 +122,8 @@ def format_range(
         merge_cells: Whether to merge the range
         protection: Cell protection settings
         conditional_format: Conditional formatting rules
+        wb: Already-loaded workbook to modify in place; saving is then
+            left to the caller
         
     Returns:
         Dictionary with operation status
@@ -79,7 +136,9 @@ def format_range(
         if end_cell and not validate_cell_reference(end_cell):
             raise ValidationError(f"Invalid end cell reference: {end_cell}")
             
-        wb = get_or_create_workbook(filepath)
+        owns_wb = wb is None
+        if owns_wb:
+            wb = get_or_create_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise ValidationError(f"Sheet '{sheet_name}' not found")
             
@@ -98,33 +157,16 @@ def format_range(
             end_col = start_col
             
         # Apply font formatting
-        font_args = {
-            "bold": bold,
-            "italic": italic,
-            "underline": 'single' if underline else None,
-        }
-        if font_size is not None:
-            font_args["size"] = font_size
-        if font_color is not None:
-            try:
-                # Ensure color has FF prefix for full opacity
-                font_color = font_color if font_color.startswith('FF') else f'FF{font_color}'
-                font_args["color"] = Color(rgb=font_color)
-            except ValueError as e:
-                raise FormattingError(f"Invalid font color: {str(e)}")
-        font = Font(**font_args)
+        try:
+            font = _font(bold, italic, underline, font_size, font_color)
+        except ValueError as e:
+            raise FormattingError(f"Invalid font color: {str(e)}")
         
         # Apply fill
         fill = None
         if bg_color is not None:
             try:
-                # Ensure color has FF prefix for full opacity
-                bg_color = bg_color if bg_color.startswith('FF') else f'FF{bg_color}'
-                fill = PatternFill(
-                    start_color=Color(rgb=bg_color),
-                    end_color=Color(rgb=bg_color),
-                    fill_type='solid'
-                )
+                fill = _fill(bg_color)
             except ValueError as e:
                 raise FormattingError(f"Invalid background color: {str(e)}")
         
@@ -132,18 +174,7 @@ def format_range(
         border = None
         if border_style is not None:
             try:
-                border_color = border_color if border_color else "000000"
-                border_color = border_color if border_color.startswith('FF') else f'FF{border_color}'
-                side = Side(
-                    style=border_style,
-                    color=Color(rgb=border_color)
-                )
-                border = Border(
-                    left=side,
-                    right=side,
-                    top=side,
-                    bottom=side
-                )
+                border = _border(border_style, border_color)
             except ValueError as e:
                 raise FormattingError(f"Invalid border settings: {str(e)}")
             
@@ -151,11 +182,7 @@ def format_range(
         align = None
         if alignment is not None or wrap_text:
             try:
-                align = Alignment(
-                    horizontal=alignment,
-                    vertical='center',
-                    wrap_text=wrap_text
-                )
+                align = _alignment(alignment, 'center', wrap_text)
             except ValueError as e:
                 raise FormattingError(f"Invalid alignment settings: {str(e)}")
             
@@ -233,7 +260,8 @@ def format_range(
             except Exception as e:
                 raise FormattingError(f"Failed to apply conditional formatting: {str(e)}")
             
-        wb.save(filepath)
+        if owns_wb:
+            wb.save(filepath)
         
         range_str = f"{start_cell}:{end_cell}" if end_cell else start_cell
         return {
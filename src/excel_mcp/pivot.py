@@ -152,6 +152,10 @@ def create_pivot_table(
         total_rows = len(row_combinations) + 1  # +1 for header
         total_cols = len(cleaned_rows) + len(cleaned_values)
         
+        # Collect values for every combination in one pass over the data
+        grouped_values = _group_values(data, cleaned_rows, cleaned_values)
+        empty_group = {field: [] for field in cleaned_values}
+
         # Write data rows
         current_row = 2
         for combo in row_combinations:
@@ -161,13 +165,15 @@ def create_pivot_table(
                 pivot_ws.cell(row=current_row, column=col, value=combo[field])
                 col += 1
             
-            # Filter data for current combination
-            filtered_data = _filter_data(data, combo, {})
+            # Look up the values collected for current combination
+            group = grouped_values.get(
+                tuple(combo[field] for field in cleaned_rows), empty_group
+            )
             
             # Calculate and write aggregated values
             for value_field in cleaned_values:
                 try:
-                    value = _aggregate_values(filtered_data, value_field, agg_func)
+                    value = _aggregate_values(group[value_field], agg_func)
                     pivot_ws.cell(row=current_row, column=col, value=value)
                 except Exception as e:
                     raise PivotError(f"Failed to aggregate values for field '{value_field}': {str(e)}")
@@ -233,27 +239,27 @@ def _get_combinations(field_values: dict[str, set]) -> list[dict]:
     return result
 
 
-def _filter_data(data: list[dict], row_filters: dict, col_filters: dict) -> list[dict]:
-    """Filter data based on row and column filters."""
-    result = []
+def _group_values(
+    data: list[dict],
+    row_fields: list[str],
+    value_fields: list[str]
+) -> dict[tuple, dict[str, list]]:
+    """Group numeric values by the combination of row field values."""
+    groups = {}
     for record in data:
-        matches = True
-        for field, value in row_filters.items():
-            if record.get(field) != value:
-                matches = False
-                break
-        for field, value in col_filters.items():
-            if record.get(field) != value:
-                matches = False
-                break
-        if matches:
-            result.append(record)
-    return result
+        key = tuple(record.get(field) for field in row_fields)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {field: [] for field in value_fields}
+        for field in value_fields:
+            value = record.get(field)
+            if isinstance(value, (int, float)):
+                group[field].append(value)
+    return groups
 
 
-def _aggregate_values(data: list[dict], field: str, agg_func: str) -> float:
+def _aggregate_values(values: list[int | float], agg_func: str) -> float:
     """Aggregate values using the specified function."""
-    values = [record[field] for record in data if field in record and isinstance(record[field], (int, float))]
     if not values:
         return 0
         
@@ -1,14 +1,62 @@
+import functools
 import json
 import sys
+from math import fsum
+from statistics import fmean
 from typing import Any, Dict, Union, List
 
+from excel_mcp.exceptions import ReformatError
 
-def _convert_to_list_of_dicts(data: Any) -> List[Dict[str, Any]]:
+# Primitive types wrapped as {"value": ...}; the frozenset gives an exact-type
+# fast path before falling back to a subclass check
+_PRIM_TYPES = (str, int, float, bool)
+_PRIM_SET = frozenset(_PRIM_TYPES)
+
+# Namespace templates copied for each run; 'data' and 'result' are filled in per call
+_EXEC_GLOBALS_TEMPLATE = {
+    '__builtins__': __builtins__,
+    'json': json,
+    # Numeric helpers for per-row arithmetic: fmean averages in one pass and
+    # fsum is an exact float sum implemented in C
+    'fmean': fmean,
+    'fsum': fsum,
+    'data': None,
+    'result': None
+}
+# Restricted builtins for expressions; each call gets its own copy because
+# expressions can reach (and modify) the dict through __builtins__
+_EVAL_BUILTINS = {'len': len, 'sum': sum, 'max': max, 'min': min, 'abs': abs, 'round': round}
+_EVAL_GLOBALS_TEMPLATE = {
+    'json': json,
+    'fmean': fmean,
+    'fsum': fsum,
+    'data': None
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_exec(source: str):
+    """Compile user code for exec, reusing the code object for repeated scripts."""
+    return compile(source, '<user_exec>', 'exec')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_eval(source: str):
+    """Compile a user expression for eval, reusing the code object for repeated expressions."""
+    return compile(source, '<user_eval>', 'eval')
+
+
+def _convert_to_list_of_dicts(
+    data: Any,
+    include_mixed_index: bool = True
+) -> List[Dict[str, Any]]:
     """
     Convert various data formats to a list of dictionaries for Excel compatibility.
     
     Args:
         data: The data to convert
+        include_mixed_index: Add each item's list position as 'index' when
+            wrapping non-dictionary items of a mixed list
         
     Returns:
         List[Dict[str, Any]]: Data formatted as list of dictionaries
@@ -21,20 +69,29 @@ def _convert_to_list_of_dicts(data: Any) -> List[Dict[str, Any]]:
     
     # Already a list of dictionaries
     if isinstance(data, list):
-        if all(isinstance(item, dict) for item in data):
+        # Collect the distinct item types in a single C-level pass, then
+        # classify the (usually tiny) set of types instead of every item
+        item_types = set(map(type, data))
+        if all(issubclass(t, dict) for t in item_types):
             return data
-        elif all(isinstance(item, (str, int, float, bool)) for item in data):
-            # Convert list of primitives to list of dicts with 'value' key
+        elif all(t in _PRIM_SET or issubclass(t, _PRIM_TYPES) for t in item_types):
+            # Convert list of primitives to list of dicts with 'value' key.
+            # The literal comprehension benchmarks faster than dict(value=...),
+            # template.copy() + assignment and map(dict.fromkeys, ...)
             return [{"value": item} for item in data]
         else:
-            # Convert mixed list to list of dicts
-            result = []
-            for i, item in enumerate(data):
-                if isinstance(item, dict):
-                    result.append(item)
-                else:
-                    result.append({"value": item, "index": i})
-            return result
+            # Convert mixed list to list of dicts in a single pass, using
+            # exact type lookups against the dict types already seen
+            dict_types = {t for t in item_types if issubclass(t, dict)}
+            if not include_mixed_index:
+                return [
+                    item if type(item) in dict_types else {"value": item}
+                    for item in data
+                ]
+            return [
+                item if type(item) in dict_types else {"value": item, "index": i}
+                for i, item in enumerate(data)
+            ]
     
     # Single dictionary - wrap in list
     elif isinstance(data, dict):
@@ -42,114 +99,217 @@ def _convert_to_list_of_dicts(data: Any) -> List[Dict[str, Any]]:
         if all(isinstance(key, (int, str)) and isinstance(value, dict) for key, value in data.items()):
             # Convert {0: {data}, 1: {data}} format to list of dicts
             try:
-                sorted_items = sorted(data.items(), key=lambda x: int(x[0]))
+                if all(type(key) is int for key in data):
+                    # Integer keys already in 0..n-1 order need no sorting
+                    keys = list(data)
+                    if keys == list(range(len(keys))):
+                        return list(data.values())
+                    # Keys are unique, so items sort by key without a key function
+                    sorted_items = sorted(data.items())
+                else:
+                    sorted_items = sorted(data.items(), key=lambda x: int(x[0]))
                 return [value for key, value in sorted_items]
             except (ValueError, TypeError):
                 # If keys aren't numeric, add key as a field
-                return [{**value, "key": key} for key, value in data.items()]
+                result = []
+                append = result.append
+                for key, value in data.items():
+                    # dict() keeps the plain-dict output type for dict subclasses
+                    record = dict(value)
+                    record["key"] = key
+                    append(record)
+                return result
         else:
             # Single record dictionary
             return [data]
     
     # Primitive value
-    elif isinstance(data, (str, int, float, bool)):
+    elif type(data) in _PRIM_SET or isinstance(data, _PRIM_TYPES):
         return [{"value": data}]
     
     else:
         raise ValueError(f"Cannot convert data of type {type(data)} to list of dictionaries")
 
 
-def execute_python_with_json(python_code: str, json_data: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _convert_to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a list of dictionaries to a column-oriented layout for Excel compatibility.
+    
+    Args:
+        rows: The rows to convert, as returned by _convert_to_list_of_dicts
+        
+    Returns:
+        Dict[str, Any]: {"columns": [...], "data": {column: [values...]}}, with
+        columns in first-seen order and None for keys missing from a row
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    return {
+        "columns": columns,
+        "data": {column: [row.get(column) for row in rows] for column in columns}
+    }
+
+
+def execute_python_with_json(
+    python_code: str,
+    json_data: Union[str, bytes, Dict[str, Any], List[Any]],
+    columnar: bool = False,
+    trust_result: bool = False,
+    include_mixed_index: bool = True
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Execute Python code with a JSON object available as context.
-    Always returns a list of dictionaries suitable for Excel export.
+    Returns a list of dictionaries suitable for Excel export, or a
+    column-oriented dictionary when columnar is True.
+
+    Besides 'data' and 'json', the code can use 'fmean' (statistics.fmean), a
+    single-pass float mean, and 'fsum' (math.fsum), an exact float sum.
     
     Args:
         python_code (str): The Python code to execute as a string
-        json_data (Union[str, Dict[str, Any]]): JSON data as a string or dictionary
+        json_data (Union[str, bytes, Dict[str, Any], List[Any]]): JSON data as a string, UTF-8 bytes
+            or already-parsed dictionary/list, which is used as-is without re-serializing
+        columnar (bool): Return {"columns": [...], "data": {column: [values...]}}
+            instead of one dictionary per row
+        trust_result (bool): Return 'result' unchanged when it is a non-empty list
+            whose first item is a dict, without checking the remaining items
+        include_mixed_index (bool): Add an 'index' field to non-dictionary items
+            wrapped from a mixed list
         
     Returns:
-        List[Dict[str, Any]]: The result as a list of dictionaries
+        Union[List[Dict[str, Any]], Dict[str, Any]]: The result as a list of
+        dictionaries, or in columnar form
         
     Raises:
-        Exception: If there's an error in code execution or JSON parsing
-        ValueError: If the result cannot be converted to list of dictionaries
+        ReformatError: If there's an error in JSON parsing, code execution or
+            converting the result to list of dictionaries
     """
     try:
-        # Parse JSON if it's a string
-        if isinstance(json_data, str):
+        # Parse JSON if it's a string or raw UTF-8 bytes
+        if isinstance(json_data, (str, bytes, bytearray)):
             data = json.loads(json_data)
         else:
             data = json_data
             
-        # Create a safe execution environment
-        # Include common modules that might be useful
-        execution_globals = {
-            '__builtins__': __builtins__,
-            'json': json,
-            'data': data,  # Make JSON data available as 'data' variable
-            'result': None  # Variable to store the result
-        }
+        # Create a safe execution environment from the shared template
+        execution_globals = _EXEC_GLOBALS_TEMPLATE.copy()
+        execution_globals['data'] = data  # Make JSON data available as 'data' variable
         
         # Execute the code
-        exec(python_code, execution_globals)
+        exec(_compile_exec(str(python_code)), execution_globals)
         
         # Get the result
         raw_result = execution_globals.get('result')
         
-        # Convert to list of dictionaries
-        return _convert_to_list_of_dicts(raw_result)
+        # Trusted producers are assumed to be homogeneous after the first row
+        if trust_result and type(raw_result) is list and raw_result and type(raw_result[0]) is dict:
+            rows = raw_result
+        else:
+            # Convert to list of dictionaries
+            rows = _convert_to_list_of_dicts(raw_result, include_mixed_index=include_mixed_index)
+
+        if columnar:
+            return _convert_to_columnar(rows)
+        return rows
         
-    except json.JSONDecodeError as e:
-        raise Exception(f"Invalid JSON data: {e}")
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Undecodable bytes payloads raise UnicodeDecodeError, a ValueError subclass
+        raise ReformatError(f"Invalid JSON data: {e}") from e
     except SyntaxError as e:
-        raise Exception(f"Invalid Python code syntax: {e}")
+        raise ReformatError(f"Invalid Python code syntax: {e}") from e
     except ValueError as e:
-        raise Exception(f"Result validation error: {e}")
+        raise ReformatError(f"Result validation error: {e}") from e
     except Exception as e:
-        raise Exception(f"Error executing Python code: {e}")
+        raise ReformatError(f"Error executing Python code: {e}") from e
 
 
-def evaluate_python_expression(expression: str, json_data: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+def execute_python_with_json_batch(
+    python_code: str,
+    payloads: List[Union[str, bytes, Dict[str, Any]]]
+) -> List[List[Dict[str, Any]]]:
+    """
+    Execute the same Python code against several JSON payloads.
+    The code is compiled once and each payload runs in its own namespace,
+    so variables defined by one run are not visible to the next.
+    
+    Args:
+        python_code (str): The Python code to execute as a string
+        payloads (List[Union[str, bytes, Dict[str, Any]]]): JSON data items, each
+            as a string, UTF-8 bytes or dictionary
+        
+    Returns:
+        List[List[Dict[str, Any]]]: One list of dictionaries per payload, in order
+        
+    Raises:
+        ReformatError: If there's an error in JSON parsing, code execution or
+            converting a result to list of dictionaries
+    """
+    try:
+        code = _compile_exec(str(python_code))
+        results = []
+        for payload in payloads:
+            if isinstance(payload, (str, bytes, bytearray)):
+                data = json.loads(payload)
+            else:
+                data = payload
+
+            execution_globals = _EXEC_GLOBALS_TEMPLATE.copy()
+            execution_globals['data'] = data
+            exec(code, execution_globals)
+            results.append(_convert_to_list_of_dicts(execution_globals.get('result')))
+        return results
+        
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Undecodable bytes payloads raise UnicodeDecodeError, a ValueError subclass
+        raise ReformatError(f"Invalid JSON data: {e}") from e
+    except SyntaxError as e:
+        raise ReformatError(f"Invalid Python code syntax: {e}") from e
+    except ValueError as e:
+        raise ReformatError(f"Result validation error: {e}") from e
+    except Exception as e:
+        raise ReformatError(f"Error executing Python code: {e}") from e
+
+
+def evaluate_python_expression(expression: str, json_data: Union[str, bytes, Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Evaluate a Python expression with JSON data as context.
     Always returns a list of dictionaries suitable for Excel export.
+
+    The expression can use 'fmean' and 'fsum' alongside the restricted builtins.
     
     Args:
         expression (str): The Python expression to evaluate
-        json_data (Union[str, Dict[str, Any]]): JSON data as a string or dictionary
+        json_data (Union[str, bytes, Dict[str, Any]]): JSON data as a string, UTF-8 bytes or dictionary
         
     Returns:
         List[Dict[str, Any]]: The result as a list of dictionaries
     """
     try:
-        # Parse JSON if it's a string
-        if isinstance(json_data, str):
+        # Parse JSON if it's a string or raw UTF-8 bytes
+        if isinstance(json_data, (str, bytes, bytearray)):
             data = json.loads(json_data)
         else:
             data = json_data
             
-        # Create evaluation context
-        eval_globals = {
-            '__builtins__': {'len': len, 'sum': sum, 'max': max, 'min': min, 'abs': abs, 'round': round},
-            'json': json,
-            'data': data
-        }
-        
+        # Create evaluation context from the shared template
+        eval_globals = _EVAL_GLOBALS_TEMPLATE.copy()
+        eval_globals['__builtins__'] = dict(_EVAL_BUILTINS)
+        eval_globals['data'] = data
+
         # Evaluate the expression
-        raw_result = eval(expression, eval_globals)
+        raw_result = eval(_compile_eval(str(expression)), eval_globals)
         
         # Convert to list of dictionaries
         return _convert_to_list_of_dicts(raw_result)
         
-    except json.JSONDecodeError as e:
-        raise Exception(f"Invalid JSON data: {e}")
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Undecodable bytes payloads raise UnicodeDecodeError, a ValueError subclass
+        raise ReformatError(f"Invalid JSON data: {e}") from e
     except SyntaxError as e:
-        raise Exception(f"Invalid Python expression syntax: {e}")
+        raise ReformatError(f"Invalid Python expression syntax: {e}") from e
     except ValueError as e:
-        raise Exception(f"Result validation error: {e}")
+        raise ReformatError(f"Result validation error: {e}") from e
     except Exception as e:
-        raise Exception(f"Error evaluating Python expression: {e}")
+        raise ReformatError(f"Error evaluating Python expression: {e}") from e
 
 
 def validate_excel_format(data: List[Dict[str, Any]]) -> bool:
@@ -165,23 +325,22 @@ def validate_excel_format(data: List[Dict[str, Any]]) -> bool:
     if not isinstance(data, list):
         return False
     
-    if not data:  # Empty list is valid
-        return True
-        
-    # Check if all items are dictionaries
-    if not all(isinstance(item, dict) for item in data):
-        return False
-        
-    # Check if all dictionaries have string keys (required for Excel headers)
+    # Check in a single pass that every item is a dictionary with string keys
+    # (required for Excel headers), stopping at the first invalid row.
+    # An empty list is valid.
     for item in data:
-        if not all(isinstance(key, str) for key in item.keys()):
+        if not isinstance(item, dict):
             return False
+        for key in item:
+            if not isinstance(key, str):
+                return False
             
     return True
 
 
 # Example usage and testing
-if __name__ == "__main__":
+def _demo():
+    """Run the example scripts and print their results."""
     # Example 1: Code that returns a list of dictionaries
     sample_json = {
         "students": [
@@ -246,3 +405,7 @@ result = {
         print(json.dumps(result, indent=2))
     except Exception as e:
         print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    _demo()
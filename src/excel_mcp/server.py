@@ -2,7 +2,14 @@ import logging
 import os
 from typing import Any, List, Dict, Union
 import asyncio
+import functools
+import inspect
 import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 from mcp.server.fastmcp import FastMCP
 
@@ -24,8 +31,14 @@ from excel_mcp.validation import (
     validate_range_in_sheet_operation as validate_range_impl
 )
 from excel_mcp.chart import create_chart_in_sheet as create_chart_impl
-from excel_mcp.workbook import get_workbook_info
-from excel_mcp.data import write_data
+from excel_mcp.calculations import apply_formula as apply_formula_impl
+from excel_mcp.formatting import format_range as format_range_func
+from excel_mcp.workbook import (
+    get_workbook_info,
+    create_workbook as create_workbook_impl,
+    create_sheet as create_worksheet_impl,
+)
+from excel_mcp.data import write_data, read_excel_range
 from excel_mcp.pivot import create_pivot_table as create_pivot_table_impl
 from excel_mcp.sheet import (
     copy_sheet,
@@ -33,7 +46,11 @@ from excel_mcp.sheet import (
     rename_sheet,
     merge_range,
     unmerge_range,
+    copy_range_operation,
+    delete_range_operation,
 )
+from excel_mcp.batch import batch_edit as batch_edit_impl
+from excel_mcp import _wb_cache
 # Import the data reformatting function
 from excel_mcp.run_reformatting_script import execute_python_with_json
 from google.cloud import storage
@@ -78,29 +95,177 @@ mcp = FastMCP(
     }
 )
 
-def get_excel_path(filename: str) -> str:
-    """Get full path to Excel file.
+# Google Cloud Storage client and buckets, created on first upload and reused
+_gcs_client: storage.Client | None = None
+_gcs_buckets: dict[str, storage.Bucket] = {}
+_gcs_lock = threading.Lock()
+
+# Upload in 8 MiB resumable chunks (must be a multiple of 256 KiB) and cap
+# concurrent uploads so overlapping calls don't exhaust the worker threads
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+_gcs_upload_semaphore = asyncio.Semaphore(4)
+
+# Signed download URLs keyed by (abs_path, mtime_ns) -> (url, expiry timestamp).
+# An unchanged file reuses its URL instead of being uploaded again, as long as
+# the URL stays valid for at least MIN_SIGNED_URL_VALIDITY more seconds.
+SIGNED_URL_LIFETIME = timedelta(hours=24)
+MIN_SIGNED_URL_VALIDITY = 3600
+MAX_CACHED_URLS = 256
+_url_cache: dict[tuple[str, int], tuple[str, float]] = {}
+
+def _get_gcs_bucket(credentials_path: str, bucket_name: str) -> storage.Bucket:
+    """Get a cached GCS bucket handle, creating the client on first use.
     
     Args:
-        filename: Name of Excel file
+        credentials_path: Path to service account JSON file
+        bucket_name: Name of GCS bucket
         
     Returns:
-        Full path to Excel file
+        Bucket handle backed by the shared storage client
     """
+    global _gcs_client
+    with _gcs_lock:
+        if _gcs_client is None:
+            logger.info("Creating credentials...")
+            
+            # Read the service account file to get project ID
+            with open(credentials_path, 'r') as f:
+                service_account_info = json.load(f)
+            
+            project_id = service_account_info.get('project_id')
+            if not project_id:
+                raise ValueError("project_id not found in service account file")
+            
+            logger.info("Project ID from service account: %s", project_id)
+            
+            # Create credentials from the service account file
+            credentials = service_account.Credentials.from_service_account_file(
+                credentials_path,
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            
+            logger.info("Creating storage client...")
+            _gcs_client = storage.Client(
+                project=project_id,
+                credentials=credentials
+            )
+        
+        bucket = _gcs_buckets.get(bucket_name)
+        if bucket is None:
+            logger.info("Getting bucket: %s", bucket_name)
+            bucket = _gcs_client.bucket(bucket_name)
+            _gcs_buckets[bucket_name] = bucket
+        return bucket
+
+# Formula validation results keyed by (abs_path, sheet_name, cell, formula).
+# Entries also record the file's mtime and are purged for a path whenever a
+# tool modifies that workbook.
+MAX_CACHED_FORMULAS = 1024
+_formula_cache: dict[tuple[str, str, str, str], tuple[int, Any]] = {}
+
+def _validate_formula_cached(full_path: str, sheet_name: str, cell: str, formula: str) -> Any:
+    """Validate a formula, reusing the result while the workbook is unchanged."""
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+    except OSError:
+        # Let the implementation report the missing file
+        return validate_formula_impl(full_path, sheet_name, cell, formula)
+
+    key = (os.path.abspath(full_path), sheet_name, cell, formula)
+    entry = _formula_cache.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    result = validate_formula_impl(full_path, sheet_name, cell, formula)
+    if len(_formula_cache) >= MAX_CACHED_FORMULAS:
+        _formula_cache.clear()
+    _formula_cache[key] = (mtime_ns, result)
+    return result
+
+def _invalidate_caches(full_path: str) -> None:
+    """Drop cached workbook and formula data after a workbook is modified."""
+    _wb_cache.invalidate(full_path)
+    path = os.path.abspath(full_path)
+    # list() snapshots the keys atomically while worker threads may be inserting
+    for key in list(_formula_cache):
+        if key[0] == path:
+            _formula_cache.pop(key, None)
+
+# Blocking openpyxl work runs on a shared pool so tool calls don't stall the
+# event loop; calls touching the same workbook are serialized by a per-path lock
+_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+_workbook_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+def _workbook_lock(full_path: str) -> asyncio.Lock:
+    """Get the lock serializing tool calls on a workbook."""
+    return _workbook_locks[os.path.abspath(full_path)]
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking function on the shared thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+@functools.lru_cache(maxsize=512)
+def _resolve_excel_path(filename: str, files_path: str | None) -> str:
+    """Resolve a filename against the Excel files directory."""
     # If filename is already an absolute path, return it
     if os.path.isabs(filename):
         return filename
 
-    # Check if in SSE mode (EXCEL_FILES_PATH is not None)
-    if EXCEL_FILES_PATH is None:
+    # Check if in SSE mode (files_path is not None)
+    if files_path is None:
         # Must use absolute path
         raise ValueError(f"Invalid filename: {filename}, must be an absolute path when not in SSE mode")
 
-    # In SSE mode, if it's a relative path, resolve it based on EXCEL_FILES_PATH
-    return os.path.join(EXCEL_FILES_PATH, filename)
+    # In SSE mode, if it's a relative path, resolve it based on files_path
+    return os.path.join(files_path, filename)
+
+def get_excel_path(filename: str) -> str:
+    """Get full path to Excel file.
+    
+    Args:
+        filename: Name of Excel file
+        
+    Returns:
+        Full path to Excel file
+    """
+    return _resolve_excel_path(filename, EXCEL_FILES_PATH)
+
+def _tool(impl, errors: tuple[type[Exception], ...], action: str):
+    """Register a tool that runs impl against the workbook named by filepath.
+
+    The decorated function only declares the tool's parameters and docstring.
+    Calls resolve filepath, run impl(full_path, **other_parameters) on the
+    shared pool under the workbook's lock, drop cached copies of the modified
+    workbook and return the result's message. Errors listed in errors are
+    returned as "Error: ..." strings; anything else is logged and re-raised.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        # functools.wraps exposes func's signature and docstring to FastMCP
+        @functools.wraps(func)
+        async def tool(*args, **kwargs) -> str:
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                full_path = get_excel_path(arguments.pop("filepath"))
+                async with _workbook_lock(full_path):
+                    result = await _run_blocking(impl, full_path, **arguments)
+                    _invalidate_caches(full_path)
+                return result["message"]
+            except errors as e:
+                return f"Error: {str(e)}"
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                raise
+
+        return mcp.tool()(tool)
+    return decorator
 
 @mcp.tool()
-def apply_formula(
+async def apply_formula(
     filepath: str,
     sheet_name: str,
     cell: str,
@@ -112,23 +277,24 @@ def apply_formula(
     """
     try:
         full_path = get_excel_path(filepath)
-        # First validate the formula
-        validation = validate_formula_impl(full_path, sheet_name, cell, formula)
-        if isinstance(validation, dict) and "error" in validation:
-            return f"Error: {validation['error']}"
-            
-        # If valid, apply the formula
-        from excel_mcp.calculations import apply_formula as apply_formula_impl
-        result = apply_formula_impl(full_path, sheet_name, cell, formula)
+        async with _workbook_lock(full_path):
+            # First validate the formula
+            validation = await _run_blocking(_validate_formula_cached, full_path, sheet_name, cell, formula)
+            if isinstance(validation, dict) and "error" in validation:
+                return f"Error: {validation['error']}"
+                
+            # If valid, apply the formula
+            result = await _run_blocking(apply_formula_impl, full_path, sheet_name, cell, formula)
+            _invalidate_caches(full_path)
         return result["message"]
     except (ValidationError, CalculationError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error applying formula: {e}")
+        logger.error("Error applying formula: %s", e)
         raise
 
 @mcp.tool()
-def validate_formula_syntax(
+async def validate_formula_syntax(
     filepath: str,
     sheet_name: str,
     cell: str,
@@ -137,16 +303,17 @@ def validate_formula_syntax(
     """Validate Excel formula syntax without applying it."""
     try:
         full_path = get_excel_path(filepath)
-        result = validate_formula_impl(full_path, sheet_name, cell, formula)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(_validate_formula_cached, full_path, sheet_name, cell, formula)
         return result["message"]
     except (ValidationError, CalculationError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error validating formula: {e}")
+        logger.error("Error validating formula: %s", e)
         raise
 
 @mcp.tool()
-def format_range(
+async def format_range(
     filepath: str,
     sheet_name: str,
     start_cell: str,
@@ -169,37 +336,38 @@ def format_range(
     """Apply formatting to a range of cells."""
     try:
         full_path = get_excel_path(filepath)
-        from excel_mcp.formatting import format_range as format_range_func
-        
-        result = format_range_func(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            start_cell=start_cell,
-            end_cell=end_cell,
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            font_size=font_size,
-            font_color=font_color,
-            bg_color=bg_color,
-            border_style=border_style,
-            border_color=border_color,
-            number_format=number_format,
-            alignment=alignment,
-            wrap_text=wrap_text,
-            merge_cells=merge_cells,
-            protection=protection,
-            conditional_format=conditional_format
-        )
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(
+                format_range_func,
+                filepath=full_path,
+                sheet_name=sheet_name,
+                start_cell=start_cell,
+                end_cell=end_cell,
+                bold=bold,
+                italic=italic,
+                underline=underline,
+                font_size=font_size,
+                font_color=font_color,
+                bg_color=bg_color,
+                border_style=border_style,
+                border_color=border_color,
+                number_format=number_format,
+                alignment=alignment,
+                wrap_text=wrap_text,
+                merge_cells=merge_cells,
+                protection=protection,
+                conditional_format=conditional_format
+            )
+            _invalidate_caches(full_path)
         return "Range formatted successfully"
     except (ValidationError, FormattingError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error formatting range: {e}")
+        logger.error("Error formatting range: %s", e)
         raise
 
 @mcp.tool()
-def read_data_from_excel(
+async def read_data_from_excel(
     filepath: str,
     sheet_name: str,
     start_cell: str = "A1",
@@ -214,19 +382,19 @@ def read_data_from_excel(
     """
     try:
         full_path = get_excel_path(filepath)
-        from excel_mcp.data import read_excel_range
-        result = read_excel_range(full_path, sheet_name, start_cell, end_cell, preview_only)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(read_excel_range, full_path, sheet_name, start_cell, end_cell, preview_only)
         if not result:
             return "No data found in specified range"
-        # Convert the list of dicts to a formatted string
-        data_str = "\n".join([str(row) for row in result])
-        return data_str
+        # Serialize the rows as a JSON list of lists; dates and other
+        # non-JSON cell values fall back to their string form
+        return json.dumps(result, default=str)
     except Exception as e:
-        logger.error(f"Error reading data: {e}")
+        logger.error("Error reading data: %s", e)
         raise
 
 @mcp.tool()
-def write_data_to_excel(
+async def write_data_to_excel(
     filepath: str,
     sheet_name: str,
     input_data: List[List],
@@ -245,44 +413,45 @@ def write_data_to_excel(
     """
     try:
         full_path = get_excel_path(filepath)
-        result = write_data(full_path, sheet_name, input_data, start_cell)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(write_data, full_path, sheet_name, input_data, start_cell)
+            _invalidate_caches(full_path)
         return result["message"]
     except (ValidationError, DataError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error writing data: {e}")
+        logger.error("Error writing data: %s", e)
         raise
 
 @mcp.tool()
-def create_workbook(filepath: str) -> str:
-    """Create new Excel workbook."""
+async def create_workbook(filepath: str, initial_data: List[List] = None) -> str:
+    """
+    Create new Excel workbook.
+
+    PARAMETERS:
+    filepath: Path to Excel file
+    initial_data: Optional list of lists written as rows to the first sheet starting at A1,
+        sublists are assumed to be rows. Faster than creating the workbook and then
+        calling write_data_to_excel
+    """
     try:
         full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_workbook as create_workbook_impl
-        result = create_workbook_impl(full_path)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(create_workbook_impl, full_path, initial_data=initial_data)
+            _invalidate_caches(full_path)
         return f"Created workbook at {full_path}"
     except WorkbookError as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error creating workbook: {e}")
+        logger.error("Error creating workbook: %s", e)
         raise
 
-@mcp.tool()
-def create_worksheet(filepath: str, sheet_name: str) -> str:
+@_tool(create_worksheet_impl, (ValidationError, WorkbookError), "creating worksheet")
+async def create_worksheet(filepath: str, sheet_name: str) -> str:
     """Create new worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.workbook import create_sheet as create_worksheet_impl
-        result = create_worksheet_impl(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, WorkbookError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating worksheet: {e}")
-        raise
 
-@mcp.tool()
-def create_chart(
+@_tool(create_chart_impl, (ValidationError, ChartError), "creating chart")
+async def create_chart(
     filepath: str,
     sheet_name: str,
     data_range: str,
@@ -293,27 +462,9 @@ def create_chart(
     y_axis: str = ""
 ) -> str:
     """Create chart in worksheet."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = create_chart_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            chart_type=chart_type,
-            target_cell=target_cell,
-            title=title,
-            x_axis=x_axis,
-            y_axis=y_axis
-        )
-        return result["message"]
-    except (ValidationError, ChartError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error creating chart: {e}")
-        raise
 
 @mcp.tool()
-def create_pivot_table(
+async def create_pivot_table(
     filepath: str,
     sheet_name: str,
     data_range: str,
@@ -325,116 +476,76 @@ def create_pivot_table(
     """Create pivot table in worksheet."""
     try:
         full_path = get_excel_path(filepath)
-        result = create_pivot_table_impl(
-            filepath=full_path,
-            sheet_name=sheet_name,
-            data_range=data_range,
-            rows=rows,
-            values=values,
-            columns=columns or [],
-            agg_func=agg_func
-        )
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(
+                create_pivot_table_impl,
+                filepath=full_path,
+                sheet_name=sheet_name,
+                data_range=data_range,
+                rows=rows,
+                values=values,
+                columns=columns or [],
+                agg_func=agg_func
+            )
+            _invalidate_caches(full_path)
         return result["message"]
     except (ValidationError, PivotError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error creating pivot table: {e}")
+        logger.error("Error creating pivot table: %s", e)
         raise
 
-@mcp.tool()
-def copy_worksheet(
+@_tool(copy_sheet, (ValidationError, SheetError), "copying worksheet")
+async def copy_worksheet(
     filepath: str,
     source_sheet: str,
     target_sheet: str
 ) -> str:
     """Copy worksheet within workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = copy_sheet(full_path, source_sheet, target_sheet)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying worksheet: {e}")
-        raise
 
-@mcp.tool()
-def delete_worksheet(
+@_tool(delete_sheet, (ValidationError, SheetError), "deleting worksheet")
+async def delete_worksheet(
     filepath: str,
     sheet_name: str
 ) -> str:
     """Delete worksheet from workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = delete_sheet(full_path, sheet_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error deleting worksheet: {e}")
-        raise
 
-@mcp.tool()
-def rename_worksheet(
+@_tool(rename_sheet, (ValidationError, SheetError), "renaming worksheet")
+async def rename_worksheet(
     filepath: str,
     old_name: str,
     new_name: str
 ) -> str:
     """Rename worksheet in workbook."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = rename_sheet(full_path, old_name, new_name)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error renaming worksheet: {e}")
-        raise
 
 @mcp.tool()
-def get_workbook_metadata(
+async def get_workbook_metadata(
     filepath: str,
     include_ranges: bool = False
 ) -> str:
     """Get metadata about workbook including sheets, ranges, etc."""
     try:
         full_path = get_excel_path(filepath)
-        result = get_workbook_info(full_path, include_ranges=include_ranges)
-        return str(result)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(get_workbook_info, full_path, include_ranges=include_ranges)
+        # Serialize as JSON rather than the dict's repr so clients can parse it
+        return json.dumps(result, default=str)
     except WorkbookError as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error getting workbook metadata: {e}")
+        logger.error("Error getting workbook metadata: %s", e)
         raise
 
-@mcp.tool()
-def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
+@_tool(merge_range, (ValidationError, SheetError), "merging cells")
+async def merge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Merge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = merge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error merging cells: {e}")
-        raise
 
-@mcp.tool()
-def unmerge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
+@_tool(unmerge_range, (ValidationError, SheetError), "unmerging cells")
+async def unmerge_cells(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> str:
     """Unmerge a range of cells."""
-    try:
-        full_path = get_excel_path(filepath)
-        result = unmerge_range(full_path, sheet_name, start_cell, end_cell)
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error unmerging cells: {e}")
-        raise
 
-@mcp.tool()
-def copy_range(
+@_tool(copy_range_operation, (ValidationError, SheetError), "copying range")
+async def copy_range(
     filepath: str,
     sheet_name: str,
     source_start: str,
@@ -443,26 +554,9 @@ def copy_range(
     target_sheet: str = None
 ) -> str:
     """Copy a range of cells to another location."""
-    try:
-        full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import copy_range_operation
-        result = copy_range_operation(
-            full_path,
-            sheet_name,
-            source_start,
-            source_end,
-            target_start,
-            target_sheet
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
-        return f"Error: {str(e)}"
-    except Exception as e:
-        logger.error(f"Error copying range: {e}")
-        raise
 
-@mcp.tool()
-def delete_range(
+@_tool(delete_range_operation, (ValidationError, SheetError), "deleting range")
+async def delete_range(
     filepath: str,
     sheet_name: str,
     start_cell: str,
@@ -470,25 +564,43 @@ def delete_range(
     shift_direction: str = "up"
 ) -> str:
     """Delete a range of cells and shift remaining cells."""
+
+@mcp.tool()
+async def batch_edit(
+    filepath: str,
+    operations: List[Dict[str, Any]]
+) -> str:
+    """
+    Apply several edits to a workbook in one open/save cycle.
+    If any operation fails, none of the edits are saved.
+
+    PARAMETERS:
+    filepath: Path to Excel file
+    operations: List of operations applied in order. Each is a dictionary with an
+        "operation" key (write_data_to_excel, apply_formula, format_range, merge_cells
+        or unmerge_cells) plus that tool's parameters, without filepath
+
+    EXAMPLE:
+    operations: [
+        {"operation": "write_data_to_excel", "sheet_name": "Sheet1", "input_data": [["Qty"], [1], [2]]},
+        {"operation": "apply_formula", "sheet_name": "Sheet1", "cell": "A4", "formula": "=SUM(A2:A3)"},
+        {"operation": "format_range", "sheet_name": "Sheet1", "start_cell": "A1", "bold": true}
+    ]
+    """
     try:
         full_path = get_excel_path(filepath)
-        from excel_mcp.sheet import delete_range_operation
-        result = delete_range_operation(
-            full_path,
-            sheet_name,
-            start_cell,
-            end_cell,
-            shift_direction
-        )
-        return result["message"]
-    except (ValidationError, SheetError) as e:
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(batch_edit_impl, full_path, operations)
+            _invalidate_caches(full_path)
+        return "\n".join([result["message"], *result["results"]])
+    except (ValidationError, WorkbookError, DataError, CalculationError, FormattingError, SheetError) as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error deleting range: {e}")
+        logger.error("Error applying batch edit: %s", e)
         raise
 
 @mcp.tool()
-def validate_excel_range(
+async def validate_excel_range(
     filepath: str,
     sheet_name: str,
     start_cell: str,
@@ -498,12 +610,13 @@ def validate_excel_range(
     try:
         full_path = get_excel_path(filepath)
         range_str = start_cell if not end_cell else f"{start_cell}:{end_cell}"
-        result = validate_range_impl(full_path, sheet_name, range_str)
+        async with _workbook_lock(full_path):
+            result = await _run_blocking(validate_range_impl, full_path, sheet_name, range_str)
         return result["message"]
     except ValidationError as e:
         return f"Error: {str(e)}"
     except Exception as e:
-        logger.error(f"Error validating range: {e}")
+        logger.error("Error validating range: %s", e)
         raise
 
 @mcp.tool()
@@ -515,56 +628,36 @@ async def create_download_link(
         bucket_name = "downloadable_excel_files"
         full_path = get_excel_path(filepath)
         filename = os.path.basename(full_path)
-        logger.info(f"Processing file: {filename}")
+        logger.info("Processing file: %s", filename)
+        
+        url_key = (os.path.abspath(full_path), os.stat(full_path).st_mtime_ns)
+        cached = _url_cache.get(url_key)
+        if cached is not None and cached[1] - time.time() > MIN_SIGNED_URL_VALIDITY:
+            logger.info("Reusing signed URL for unchanged file: %s", filename)
+            return f"Public URL: {cached[0]}"
         
         # Handle Google Cloud credentials - read from service account file
         credentials_path = './src/excel_mcp/service-account.json'
         
-        logger.info(f"Credentials path: {credentials_path}")
+        logger.debug("Credentials path: %s", credentials_path)
         
         if not os.path.exists(credentials_path):
-            logger.error(f"Service account file not found: {credentials_path}")
+            logger.error("Service account file not found: %s", credentials_path)
             return f"Error: Service account file not found: {credentials_path}"
         
         # Define the upload function that will run in a separate thread
         def upload_to_gcs():
-            logger.info("Creating credentials...")
+            bucket = _get_gcs_bucket(credentials_path, bucket_name)
+            blob = bucket.blob(filename, chunk_size=GCS_UPLOAD_CHUNK_SIZE)
             
-            # Read the service account file to get project ID
-            with open(credentials_path, 'r') as f:
-                service_account_info = json.load(f)
-            
-            project_id = service_account_info.get('project_id')
-            if not project_id:
-                raise ValueError("project_id not found in service account file")
-            
-            logger.info(f"Project ID from service account: {project_id}")
-            
-            # Create credentials from the service account file
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path,
-                scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
-            
-            logger.info("Creating storage client...")
-            storage_client = storage.Client(
-                project=project_id,
-                credentials=credentials
-            )
-            
-            logger.info(f"Getting bucket: {bucket_name}")
-            bucket = storage_client.bucket(bucket_name)
-            blob = bucket.blob(filename)
-            
-            logger.info(f"Uploading file: {full_path}")
+            logger.info("Uploading file: %s", full_path)
             blob.upload_from_filename(full_path)
             
             logger.info("Generating signed URL...")
             # Generate a signed URL that's valid for 24 hours
-            from datetime import timedelta
             signed_url = blob.generate_signed_url(
                 version="v4",
-                expiration=timedelta(hours=24),
+                expiration=SIGNED_URL_LIFETIME,
                 method="GET"
             )
             
@@ -572,16 +665,26 @@ async def create_download_link(
         
         # Run the blocking operation in a separate thread
         logger.info("Running upload in thread...")
-        public_url = await asyncio.to_thread(upload_to_gcs)
+        # Expiry is taken before uploading so the cached value never overstates it
+        expiry = time.time() + SIGNED_URL_LIFETIME.total_seconds()
+        async with _gcs_upload_semaphore:
+            public_url = await asyncio.to_thread(upload_to_gcs)
         
-        logger.info(f"Upload successful: {public_url}")
+        # Blobs are named by basename, so this upload replaced the content behind
+        # any URL cached for another file with the same name
+        for key in list(_url_cache):
+            if os.path.basename(key[0]) == filename:
+                del _url_cache[key]
+        if len(_url_cache) >= MAX_CACHED_URLS:
+            _url_cache.clear()
+        _url_cache[url_key] = (public_url, expiry)
+        
+        logger.info("Upload successful: %s", public_url)
         return f"Public URL: {public_url}"
         
     except Exception as e:
-        logger.error(f"Error uploading file to GCS: {e}")
-        logger.error(f"Exception type: {type(e).__name__}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # logger.exception records the exception type and traceback
+        logger.exception("Error uploading file to GCS: %s", e)
         return f"Error uploading file: {str(e)}"
 
 # @mcp.tool()
@@ -625,17 +728,10 @@ async def create_download_link(
 #     Returns: JSON string of List[Dict] format ready for write_data_to_excel
 #     """
 #     try:
-#         # Handle both string JSON and already-parsed data
-#         if isinstance(json_data, str):
-#             # It's a JSON string, use as-is
-#             data_to_pass = json_data
-#         else:
-#             # It's already parsed data (list/dict), convert to JSON string
-#             data_to_pass = json.dumps(json_data)
-        
-#         # Execute the Python code with the JSON data
+#         # Execute the Python code with the JSON data. Strings are parsed once,
+#         # already-parsed data (list/dict) is used as-is without a dumps/loads round-trip.
 #         # This returns List[Dict] which is exactly what we need
-#         formatted_result = execute_python_with_json(python_code, data_to_pass)
+#         formatted_result = execute_python_with_json(python_code, json_data)
         
 #         # Return as JSON string - already in List[Dict] format
 #         return json.dumps(formatted_result)
@@ -649,17 +745,18 @@ async def run_sse():
     # Assign value to EXCEL_FILES_PATH in SSE mode
     global EXCEL_FILES_PATH
     EXCEL_FILES_PATH = os.environ.get("EXCEL_FILES_PATH", "./excel_files")
+    _resolve_excel_path.cache_clear()
     # Create directory if it doesn't exist
     os.makedirs(EXCEL_FILES_PATH, exist_ok=True)
     
     try:
-        logger.info(f"Starting Excel MCP server with SSE transport (files directory: {EXCEL_FILES_PATH})")
+        logger.info("Starting Excel MCP server with SSE transport (files directory: %s)", EXCEL_FILES_PATH)
         await mcp.run_sse_async()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         await mcp.shutdown()
     except Exception as e:
-        logger.error(f"Server failed: {e}")
+        logger.error("Server failed: %s", e)
         raise
     finally:
         logger.info("Server shutdown complete")
@@ -674,7 +771,7 @@ def run_stdio():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed: {e}")
+        logger.error("Server failed: %s", e)
         raise
     finally:
         logger.info("Server shutdown complete")
\ No newline at end of file
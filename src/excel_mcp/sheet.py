@@ -2,7 +2,7 @@ import logging
 from typing import Any
 from copy import copy
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter, column_index_from_string
 from openpyxl.styles import Font, Border, PatternFill, Side
@@ -186,10 +186,23 @@ def delete_range(worksheet: Worksheet, start_cell: str, end_cell: str | None = N
             cell.number_format = "General"
             cell.alignment = None
 
-def merge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> dict[str, Any]:
-    """Merge a range of cells."""
+def merge_range(
+    filepath: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    *,
+    wb: Workbook | None = None
+) -> dict[str, Any]:
+    """Merge a range of cells.
+
+    When an already-loaded workbook is passed as wb, it is modified
+    in place and saving is left to the caller.
+    """
     try:
-        wb = load_workbook(filepath)
+        owns_wb = wb is None
+        if owns_wb:
+            wb = load_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise SheetError(f"Sheet '{sheet_name}' not found")
             
@@ -201,7 +214,8 @@ def merge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str)
         range_string = format_range_string(start_row, start_col, end_row, end_col)
         worksheet = wb[sheet_name]
         worksheet.merge_cells(range_string)
-        wb.save(filepath)
+        if owns_wb:
+            wb.save(filepath)
         return {"message": f"Range '{range_string}' merged in sheet '{sheet_name}'"}
     except SheetError as e:
         logger.error(str(e))
@@ -210,10 +224,23 @@ def merge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str)
         logger.error(f"Failed to merge range: {e}")
         raise SheetError(str(e))
 
-def unmerge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str) -> dict[str, Any]:
-    """Unmerge a range of cells."""
+def unmerge_range(
+    filepath: str,
+    sheet_name: str,
+    start_cell: str,
+    end_cell: str,
+    *,
+    wb: Workbook | None = None
+) -> dict[str, Any]:
+    """Unmerge a range of cells.
+
+    When an already-loaded workbook is passed as wb, it is modified
+    in place and saving is left to the caller.
+    """
     try:
-        wb = load_workbook(filepath)
+        owns_wb = wb is None
+        if owns_wb:
+            wb = load_workbook(filepath)
         if sheet_name not in wb.sheetnames:
             raise SheetError(f"Sheet '{sheet_name}' not found")
             
@@ -234,7 +261,8 @@ def unmerge_range(filepath: str, sheet_name: str, start_cell: str, end_cell: str
             raise SheetError(f"Range '{range_string}' is not merged")
             
         worksheet.unmerge_cells(range_string)
-        wb.save(filepath)
+        if owns_wb:
+            wb.save(filepath)
         return {"message": f"Range '{range_string}' unmerged successfully"}
     except SheetError as e:
         logger.error(str(e))
@@ -1,3 +1,4 @@
+import functools
 import logging
 import re
 from typing import Any
@@ -11,6 +12,12 @@ from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Cell or range references inside a formula, e.g. A1 or A1:B2
+CELL_REF_PATTERN = re.compile(r'[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?')
+# Function names inside a formula, e.g. SUM(
+FUNC_PATTERN = re.compile(r"([A-Z]+)\(")
+UNSAFE_FUNCS = frozenset({"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"})
+
 def validate_formula_in_cell_operation(
     filepath: str,
     sheet_name: str,
@@ -32,7 +39,7 @@ def validate_formula_in_cell_operation(
             raise ValidationError(f"Invalid formula syntax: {message}")
 
         # Additional validation for cell references in formula
-        cell_refs = re.findall(r'[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?', formula)
+        cell_refs = CELL_REF_PATTERN.findall(formula)
         for ref in cell_refs:
             if ':' in ref:  # Range reference
                 start, end = ref.split(':')
@@ -162,8 +169,13 @@ def validate_range_in_sheet_operation(
         logger.error(f"Failed to validate range: {e}")
         raise ValidationError(str(e))
 
+@functools.lru_cache(maxsize=1024)
 def validate_formula(formula: str) -> tuple[bool, str]:
-    """Validate Excel formula syntax and safety"""
+    """Validate Excel formula syntax and safety
+    
+    Results depend only on the formula text, so they are memoized for
+    formulas applied or validated repeatedly.
+    """
     if not formula.startswith("="):
         return False, "Formula must start with '='"
 
@@ -184,12 +196,10 @@ def validate_formula(formula: str) -> tuple[bool, str]:
         return False, "Unclosed parenthesis"
 
     # Basic function name validation
-    func_pattern = r"([A-Z]+)\("
-    funcs = re.findall(func_pattern, formula)
-    unsafe_funcs = {"INDIRECT", "HYPERLINK", "WEBSERVICE", "DGET", "RTD"}
+    funcs = FUNC_PATTERN.findall(formula)
 
     for func in funcs:
-        if func in unsafe_funcs:
+        if func in UNSAFE_FUNCS:
             return False, f"Unsafe function: {func}"
 
     return True, "Formula is valid"
@@ -1,4 +1,6 @@
 import logging
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
@@ -6,19 +8,35 @@ from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
 
 from .exceptions import WorkbookError
+from ._wb_cache import get_workbook
 
 logger = logging.getLogger(__name__)
 
-def create_workbook(filepath: str, sheet_name: str = "Sheet1") -> dict[str, Any]:
-    """Create a new Excel workbook with optional custom sheet name"""
+def create_workbook(
+    filepath: str,
+    sheet_name: str = "Sheet1",
+    initial_data: list[list] | None = None
+) -> dict[str, Any]:
+    """Create a new Excel workbook with optional custom sheet name
+
+    When initial_data is given, its rows are streamed into the sheet through a
+    write-only workbook, so the file is written in a single pass. The returned
+    workbook is then already saved and cannot be modified further.
+    """
     try:
-        wb = Workbook()
-        # Rename default sheet
-        if "Sheet" in wb.sheetnames:
-            sheet = wb["Sheet"]
-            sheet.title = sheet_name
+        if initial_data:
+            wb = Workbook(write_only=True)
+            sheet = wb.create_sheet(sheet_name)
+            for row in initial_data:
+                sheet.append(row)
         else:
-            wb.create_sheet(sheet_name)
+            wb = Workbook()
+            # Rename default sheet
+            if "Sheet" in wb.sheetnames:
+                sheet = wb["Sheet"]
+                sheet.title = sheet_name
+            else:
+                wb.create_sheet(sheet_name)
 
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -60,6 +78,18 @@ def create_sheet(filepath: str, sheet_name: str) -> dict:
         logger.error(f"Failed to create sheet: {e}")
         raise WorkbookError(str(e))
 
+# Namespace of the SpreadsheetML elements in xl/workbook.xml
+_SPREADSHEETML_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+def _read_sheet_names(filepath: str) -> list[str]:
+    """Read sheet names straight from xl/workbook.xml without parsing any worksheet."""
+    with zipfile.ZipFile(filepath) as archive:
+        root = ET.fromstring(archive.read("xl/workbook.xml"))
+    sheets = root.find(f"{_SPREADSHEETML_NS}sheets")
+    if sheets is None:
+        raise ValueError("Workbook has no sheets element")
+    return [sheet.get("name") for sheet in sheets.iter(f"{_SPREADSHEETML_NS}sheet")]
+
 def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str, Any]:
     """Get metadata about workbook including sheets, ranges, etc."""
     try:
@@ -67,13 +97,24 @@ def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str,
         if not path.exists():
             raise WorkbookError(f"File not found: {filepath}")
             
-        wb = load_workbook(filepath, read_only=False)
+        sheet_names = None
+        if not include_ranges:
+            # Sheet names only need workbook.xml, skip loading the worksheets
+            try:
+                sheet_names = _read_sheet_names(filepath)
+            except (zipfile.BadZipFile, KeyError, ET.ParseError, ValueError) as e:
+                logger.debug("Falling back to full load for %s: %s", filepath, e)
+                
+        if sheet_names is None:
+            wb = get_workbook(filepath)
+            sheet_names = wb.sheetnames
         
+        stat = path.stat()
         info = {
             "filename": path.name,
-            "sheets": wb.sheetnames,
-            "size": path.stat().st_size,
-            "modified": path.stat().st_mtime
+            "sheets": sheet_names,
+            "size": stat.st_size,
+            "modified": stat.st_mtime
         }
         
         if include_ranges:
@@ -85,7 +126,6 @@ def get_workbook_info(filepath: str, include_ranges: bool = False) -> dict[str,
                     ranges[sheet_name] = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
             info["used_ranges"] = ranges
             
-        wb.close()
         return info
         
     except WorkbookError as e: